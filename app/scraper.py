@@ -1,61 +1,517 @@
+import asyncio
+import multiprocessing
+import os
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-import json
-from typing import List, Dict, Optional, Set
+from requests.adapters import HTTPAdapter
+from lxml import etree
+from lxml import html as lxml_html
+import orjson
+import hashlib
+import posixpath
+import codecs
+import re
+import sqlite3
+from functools import lru_cache
+from typing import BinaryIO, Callable, List, Dict, Optional, Set, Tuple, Union
 from urllib.parse import urljoin, urlparse
-from collections import deque
+from urllib.robotparser import RobotFileParser
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from pybloom_live import ScalableBloomFilter
+
+try:
+    import brotli  # Lets requests/urllib3 and aiohttp decode br responses
+except ImportError:
+    brotli = None
+
+try:
+    import cchardet  # C charset detector, only used for pages that declare no charset
+except ImportError:
+    cchardet = None
+
+USER_AGENT = "BasicWebScraper/1.0"
+# Only advertise br when it can be decoded; sites typically serve br 20-30% smaller than gzip
+ACCEPT_ENCODING = 'br, gzip, deflate' if brotli else 'gzip, deflate'
+DEFAULT_HEADERS = {'User-Agent': USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING}
+
+# Links to these are never HTML, so they are not worth a request
+_NON_HTML_EXTENSIONS = frozenset({
+    '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico', '.bmp',
+    '.zip', '.gz', '.tar', '.rar', '.7z', '.exe', '.dmg', '.apk',
+    '.mp3', '.mp4', '.avi', '.mov', '.webm', '.wav',
+    '.css', '.js', '.json', '.xml', '.woff', '.woff2', '.ttf',
+})
+_HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+
+# smart_strings=False returns plain str, not results that keep the whole tree alive
+_HREF_XPATH = etree.XPath('//a/@href', smart_strings=False)
+_BASE_HREF_XPATH = etree.XPath('string(//base/@href)', smart_strings=False)
+
+@lru_cache(maxsize=128)
+def _selector(tags: Tuple[Tuple[str, Optional[str]], ...]) -> Tuple[etree.XPath, Dict[str, str]]:
+    """
+    Compile (once per tags tuple) a single XPath selecting every requested (tag, class).
+
+    One union expression walks the tree once instead of once per tag. Class names are
+    bound as XPath variables, returned alongside the expression, so they need no quoting.
+    """
+    branches = []
+    variables = {}
+    for i, (tag, class_name) in enumerate(tags):
+        if class_name is None:
+            branches.append(f"//{tag}")
+        else:
+            # Match the class as a whitespace-separated token, like BeautifulSoup's class_ did
+            branches.append(f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), concat(' ', $c{i}, ' '))]")
+            variables[f"c{i}"] = class_name
+    return etree.XPath(" | ".join(branches)), variables
+
+def _has_non_html_extension(url: str) -> bool:
+    """Check if a URL's path ends in an extension that is never HTML."""
+    path = url.split('#', 1)[0].split('?', 1)[0]
+    return posixpath.splitext(path)[1].lower() in _NON_HTML_EXTENSIONS
+
+def _is_html_response(content_type: Optional[str]) -> bool:
+    """Check a Content-Type header; a missing header is given the benefit of the doubt."""
+    if not content_type:
+        return True
+    return content_type.split(';', 1)[0].strip().lower() in _HTML_CONTENT_TYPES
+
+def _origin(url: str) -> str:
+    """Return the "scheme://netloc" of an absolute URL without a full urlparse."""
+    scheme, sep, rest = url.partition('://')
+    if not sep:
+        return url
+    end = len(rest)
+    for delimiter in '/?#':
+        i = rest.find(delimiter)
+        if i != -1 and i < end:
+            end = i
+    return f"{scheme}://{rest[:end]}"
+
+def _join(base: str, href: str) -> str:
+    """
+    Resolve `href` against the page URL `base`, memoised.
+
+    Root-relative, scheme-relative and absolute hrefs resolve the same way from every page
+    of a site, so they are cached by the page's origin and navigation-bar links hit the
+    cache across pages. Path-relative hrefs depend on the page and are cached per page.
+    """
+    if href.startswith(('/', 'http://', 'https://')):
+        return _cached_urljoin(_origin(base), href)
+    return _cached_urljoin(base, href)
+
+@lru_cache(maxsize=8192)
+def _cached_urljoin(base: str, href: str) -> str:
+    """urljoin behind the cache shared by _join."""
+    return urljoin(base, href)
+
+def _charset(content_type: Optional[str]) -> Optional[str]:
+    """Return the charset declared in a Content-Type header, if any."""
+    if not content_type:
+        return None
+    for param in content_type.split(';')[1:]:
+        name, _, value = param.partition('=')
+        if name.strip().lower() == 'charset':
+            return value.strip().strip('"\'') or None
+    return None
+
+def _detect_encoding(body: bytes, declared: Optional[str]) -> Optional[str]:
+    """
+    Pick the encoding to parse `body` with, running detection only when nothing declares one.
+
+    A known Content-Type charset is used as-is, and a BOM or <meta charset> in the first
+    1024 bytes is left to libxml2; None means "let libxml2 decide". An unknown declared
+    charset counts as undeclared.
+    """
+    if declared:
+        try:
+            codecs.lookup(declared)
+            return declared
+        except LookupError:
+            pass
+    head = body[:1024]
+    if head.startswith(_BOMS) or _META_CHARSET_RE.search(head):
+        return None
+    if cchardet is not None:
+        return cchardet.detect(body).get('encoding')
+    try:
+        body.decode('utf-8')  # Undeclared pages are nearly always UTF-8 when they validate as it
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return None
+
+@lru_cache(maxsize=32)
+def _parser(encoding: Optional[str]) -> lxml_html.HTMLParser:
+    """Return a shared HTML parser for `encoding`; None lets libxml2 sniff <meta charset>."""
+    try:
+        return lxml_html.HTMLParser(encoding=encoding)
+    except LookupError:  # Charset unknown to libxml2, sniff instead
+        return lxml_html.HTMLParser()
+
+def _parse_tree(html: Union[str, bytes], encoding: Optional[str] = None) -> Optional[lxml_html.HtmlElement]:
+    """
+    Parse HTML into an lxml tree, or return None for an empty document.
+
+    `encoding` is the charset declared for bytes input; see _detect_encoding.
+    """
+    if isinstance(html, str):
+        # lxml refuses str input that carries an XML encoding declaration, so go through bytes
+        html, encoding = html.encode('utf-8'), 'utf-8'
+    else:
+        encoding = _detect_encoding(html, encoding)
+    try:
+        # Bytes go straight to libxml2, which decodes them itself
+        return lxml_html.fromstring(html, parser=_parser(encoding))
+    except etree.ParserError:
+        return None
+
+# Page parsing lives in module-level functions so it can run in worker processes
+def _extract(tree: lxml_html.HtmlElement, tags: Tuple[Tuple[str, Optional[str]], ...]) -> Dict[str, List[str]]:
+    """Extract element text for every requested (tag, class) from an already parsed page."""
+    results = {tag: [] for tag, _ in tags}
+    if not tags:
+        return results
+    selector, variables = _selector(tags)
+    for element in selector(tree, **variables):
+        results[element.tag].append(element.text_content().strip())
+    return results
+
+def _is_internal(url: str, base_prefix: str, base_netloc: str) -> bool:
+    """Check if a URL is on the host `base_netloc`, whose root URL is `base_prefix`."""
+    if url.startswith(base_prefix):
+        return True  # Common case, no parsing needed
+    # Other scheme, host letter case or a missing trailing slash
+    return urlparse(url).netloc.lower() == base_netloc
+
+def _links(tree: lxml_html.HtmlElement, base_url: str, base_prefix: str, base_netloc: str) -> Set[str]:
+    """Extract internal links from an already parsed page."""
+    base_href = _BASE_HREF_XPATH(tree).strip()
+    if base_href:
+        base_url = urljoin(base_url, base_href)  # Relative links resolve against <base href>
+    links = set()
+    for href in _HREF_XPATH(tree):
+        # Absolute hrefs go through urljoin too: it strips stray whitespace and empty ?/#
+        url = _join(base_url, href)
+        if _is_internal(url, base_prefix, base_netloc) and not _has_non_html_extension(url):
+            links.add(url)
+    return links
+
+def _parse_worker(body: bytes, encoding: Optional[str], tags: Tuple[Tuple[str, Optional[str]], ...],
+                  url: str, base_prefix: str, base_netloc: str) -> Dict[str, List[str]]:
+    """Extract the requested (tag, class) pairs and internal links from a fetched page body."""
+    tree = _parse_tree(body, encoding)  # Parse once and share the tree across all tags
+    if tree is None:
+        return {**{tag: [] for tag, _ in tags}, 'links': []}
+    
+    results = _extract(tree, tags)
+    results['links'] = list(_links(tree, url, base_prefix, base_netloc))
+    return results
+
+def _robots_parser(robots_url: str, status: Optional[int], text: str) -> RobotFileParser:
+    """
+    Build the parser for a robots.txt response, following the same rules as RobotFileParser.read.
+
+    `status` is None when the file could not be fetched at all.
+    """
+    robots = RobotFileParser(robots_url)
+    if status is None:
+        robots.allow_all = True
+    elif status in (401, 403) or status >= 500:
+        robots.disallow_all = True
+    elif status >= 400:
+        robots.allow_all = True
+    else:
+        robots.parse(text.splitlines())
+    return robots
 
 class BasicWebScraper:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, concurrency: int = 10, respect_robots: bool = True,
+                 cache_path: Optional[str] = None):
         self.base_url = base_url
-        self.visited = set()  # Track visited URLs to avoid re-visiting
+        base = urlparse(base_url)
+        self._base_netloc = base.netloc.lower()
+        self._base_prefix = f"{base.scheme}://{self._base_netloc}/"  # Internal URLs almost always start with this
+        self.concurrency = concurrency  # Max pages fetched at once by scrape_multiple_pages/crawl
+        self.visited: Set[bytes] = set()  # Digests of visited URLs, see _key
+        # URLs ever queued by crawl; probabilistic, ~10 bits per URL (0.1% false positives)
+        self.seen = ScalableBloomFilter(initial_capacity=10_000, error_rate=0.001)
+        self.respect_robots = respect_robots  # Keep URLs disallowed by robots.txt out of crawls
+        self._robots: Dict[str, RobotFileParser] = {}  # Parsed robots.txt per host
+        # SQLite table of validators and results per URL for conditional GETs on repeat
+        # crawls; pages live on disk, not in memory. Off without a cache_path.
+        self.cache_path = cache_path
+        self._http_cache: Optional[sqlite3.Connection] = self._open_cache() if cache_path else None
+        # ETag/Last-Modified of responses still being parsed, written together with the page
+        self._fresh_validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+        # One session per scraper so keep-alive connections are reused across pages
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+
+        # Parsing is CPU-bound, so concurrent crawls spread it across cores; see _executor
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def close(self):
+        """Save the HTTP cache and shut down the parsing processes and the HTTP session."""
+        if self._http_cache is not None:
+            self._flush_cache()
+            self._http_cache.close()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.session.close()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        """Return the parsing process pool, starting it on first use."""
+        if self._pool is None:
+            # Workers start inside a running event loop whose resolver threads must not be
+            # forked, so use a fork server (or spawn where that is unavailable)
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                             mp_context=multiprocessing.get_context(method))
+        return self._pool
+
+    def _open_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the HTTP cache at cache_path, creating it on first use."""
+        try:
+            db = sqlite3.connect(self.cache_path)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                "url TEXT PRIMARY KEY, tags BLOB, etag TEXT, last_modified TEXT, body_hash TEXT, page BLOB)"
+            )
+            return db
+        except sqlite3.Error as e:
+            print(f"An error occurred while opening the cache: {e}")
+            return None
+
+    def _flush_cache(self):
+        """Commit pending HTTP cache writes so a crash loses at most the current batch."""
+        if self._http_cache is None:
+            return
+        try:
+            self._http_cache.commit()
+        except sqlite3.Error as e:
+            print(f"An error occurred while saving the cache: {e}")
+
+    @staticmethod
+    def _cache_tags(tags: Tuple[Tuple[str, Optional[str]], ...]) -> bytes:
+        """Serialise a tags tuple for the cache's tags column, independent of the tags' order."""
+        return orjson.dumps(sorted(tags))
+
+    def _conditional_headers(self, url: str, tags: Tuple[Tuple[str, Optional[str]], ...]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a URL with a reusable cached page."""
+        if self._http_cache is None:
+            return {}
+        row = self._http_cache.execute(
+            "SELECT etag, last_modified FROM http_cache WHERE url = ? AND tags = ?",
+            (url, self._cache_tags(tags)),
+        ).fetchone()
+        headers = {}
+        if row is not None:
+            etag, last_modified = row
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _remember_validators(self, url: str, etag: Optional[str], last_modified: Optional[str]):
+        """Hold the ETag/Last-Modified of a full (200) response until its page is stored."""
+        if self._http_cache is not None:
+            self._fresh_validators[url] = (etag, last_modified)
+
+    def _reuse_page(self, url: str, tags: Tuple[Tuple[str, Optional[str]], ...],
+                    body: Optional[bytes]) -> Optional[Dict[str, List[str]]]:
+        """Return the cached page for a 304 (body None) or a byte-identical body, else None."""
+        if self._http_cache is None:
+            return None
+        row = self._http_cache.execute(
+            "SELECT body_hash, page FROM http_cache WHERE url = ? AND tags = ?",
+            (url, self._cache_tags(tags)),
+        ).fetchone()
+        if row is None:
+            return None
+        body_hash, page = row
+        if body is None:
+            return orjson.loads(page)
+        if hashlib.blake2b(body, digest_size=16).hexdigest() == body_hash:
+            # Same content under new validators; keep the stored page
+            etag, last_modified = self._fresh_validators.pop(url, (None, None))
+            self._http_cache.execute(
+                "UPDATE http_cache SET etag = ?, last_modified = ? WHERE url = ?",
+                (etag, last_modified, url),
+            )
+            return orjson.loads(page)
+        return None
+
+    def _remember_page(self, url: str, tags: Tuple[Tuple[str, Optional[str]], ...], body: bytes,
+                       page: Dict[str, List[str]]):
+        """Store a freshly parsed page so an unchanged response can reuse it next time."""
+        if self._http_cache is None:
+            return
+        # Validators and page are written together, so a crash never pairs new validators with an old page
+        etag, last_modified = self._fresh_validators.pop(url, (None, None))
+        self._http_cache.execute(
+            "INSERT OR REPLACE INTO http_cache (url, tags, etag, last_modified, body_hash, page) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (url, self._cache_tags(tags), etag, last_modified,
+             hashlib.blake2b(body, digest_size=16).hexdigest(), orjson.dumps(page)),
+        )
+
+    @staticmethod
+    def _key(url: str) -> bytes:
+        """Return the compact 16-byte digest stored in `visited` for a URL."""
+        return hashlib.blake2b(url.encode(), digest_size=16).digest()
+
+    async def _allowed(self, session: aiohttp.ClientSession, url: str) -> bool:
+        """Check a URL against its host's robots.txt, fetching and caching that file on first use."""
+        if not self.respect_robots:
+            return True
+        parts = urlparse(url)
+        netloc = parts.netloc.lower()
+        robots = self._robots.get(netloc)
+        if robots is None:
+            robots = self._robots[netloc] = await self._load_robots(session, f"{parts.scheme}://{parts.netloc}/robots.txt")
+        return robots.can_fetch(USER_AGENT, url)
 
-    def fetch_html(self, url: str) -> Optional[str]:
-        """Fetch HTML content from a given URL."""
+    async def _load_robots(self, session: aiohttp.ClientSession, robots_url: str) -> RobotFileParser:
+        """Fetch and parse a robots.txt without blocking the event loop."""
         try:
-            response = requests.get(url)
-            response.raise_for_status()  # Raise exception for HTTP errors
-            return response.text
+            async with session.get(robots_url) as response:
+                status = response.status
+                text = await response.text(errors='replace') if status < 400 else ''
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching {robots_url}: {e}")
+            return _robots_parser(robots_url, None, '')
+        return _robots_parser(robots_url, status, text)
+
+    def fetch_html(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[Tuple[Optional[bytes], Optional[str]]]:
+        """
+        Fetch the raw HTML body of a URL and the charset declared by its Content-Type header.
+
+        `headers` are sent with the request; for a conditional request answered with
+        304 Not Modified the returned body is None.
+        """
+        try:
+            # stream=True defers the body so non-HTML responses are dropped unread
+            with self.session.get(url, stream=True, timeout=10, headers=headers) as response:
+                if response.status_code == 304:
+                    return None, None
+                response.raise_for_status()  # Raise exception for HTTP errors
+                content_type = response.headers.get('Content-Type')
+                if not _is_html_response(content_type):
+                    print(f"Skipping {url}: not HTML ({content_type})")
+                    return None
+                self._remember_validators(url, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return response.content, _charset(content_type)
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
 
-    def parse_elements(self, html: str, tag: str, class_name: Optional[str] = None) -> List[str]:
-        """Extract elements from HTML based on the tag and optional class name."""
-        soup = BeautifulSoup(html, 'html.parser')
-        elements = soup.find_all(tag, class_=class_name)
-        return [element.get_text(strip=True) for element in elements]
-
-    def get_links(self, html: str, base_url: str) -> Set[str]:
-        """Extract all valid internal links from the HTML page."""
-        soup = BeautifulSoup(html, 'html.parser')
-        links = set()
-        for link in soup.find_all('a', href=True):
-            url = urljoin(base_url, link['href'])  # Resolve relative URLs
-            if self.is_internal_url(url):
-                links.add(url)
-        return links
+    def parse_elements(self, html: Union[str, bytes], tag: str, class_name: Optional[str] = None,
+                       encoding: Optional[str] = None) -> List[str]:
+        """
+        Extract elements from HTML based on the tag and optional class name.
+
+        For bytes input, `encoding` is the declared charset, e.g. the one returned by fetch_html.
+        """
+        tree = _parse_tree(html, encoding)
+        return _extract(tree, ((tag, class_name),))[tag] if tree is not None else []
+
+    def get_links(self, html: Union[str, bytes], base_url: str, encoding: Optional[str] = None) -> Set[str]:
+        """
+        Extract all valid internal links from the HTML page.
+
+        For bytes input, `encoding` is the declared charset, e.g. the one returned by fetch_html.
+        """
+        # No SoupStrainer-style pre-filter needed: lxml builds the tree in C and
+        # only the matched href strings are turned into Python objects.
+        tree = _parse_tree(html, encoding)
+        return _links(tree, base_url, self._base_prefix, self._base_netloc) if tree is not None else set()
 
     def is_internal_url(self, url: str) -> bool:
         """Check if a URL is within the same domain as the base URL."""
-        return urlparse(url).netloc == urlparse(self.base_url).netloc
+        return _is_internal(url, self._base_prefix, self._base_netloc)
     
     def scrape_page(self, url: str, tags: Dict[str, Optional[str]]) -> Dict[str, List[str]]:
         """Scrape data from a single page based on tags and classes."""
-        html = self.fetch_html(url)
-        if html is None:
+        tags_key = tuple(tags.items())
+        fetched = self.fetch_html(url, self._conditional_headers(url, tags_key))
+        if fetched is None:
             return {}
+        body, encoding = fetched
+        page = self._reuse_page(url, tags_key, body)
+        if page is not None:
+            return page
+        if body is None:
+            return {}  # 304 for a page that is no longer cached
         
-        results = {}
-        for tag, class_name in tags.items():
-            results[tag] = self.parse_elements(html, tag, class_name)
+        page = _parse_worker(body, encoding, tags_key, url, self._base_prefix, self._base_netloc)
+        self._remember_page(url, tags_key, body, page)
+        self._flush_cache()
+        return page
+
+    def _client_session(self) -> aiohttp.ClientSession:
+        """Create the aiohttp session used for concurrent fetching."""
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=10)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            auto_decompress=True,
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str,
+                     headers: Optional[Dict[str, str]] = None) -> Optional[Tuple[Optional[bytes], Optional[str]]]:
+        """Asynchronous fetch_html."""
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return None, None
+                response.raise_for_status()  # Raise exception for HTTP errors
+                content_type = response.headers.get('Content-Type')
+                if not _is_html_response(content_type):
+                    print(f"Skipping {url}: not HTML ({content_type})")
+                    return None  # Leaving the context releases the connection unread
+                body = await response.read()
+                self._remember_validators(url, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return body, response.charset
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    async def _fetch_and_parse(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                               url: str, tags: Dict[str, Optional[str]]) -> Dict[str, List[str]]:
+        """Fetch a page under the concurrency limit, then parse it in the process pool."""
+        tags_key = tuple(tags.items())
+        async with semaphore:
+            print(f"Scraping {url}")
+            fetched = await self._fetch(session, url, self._conditional_headers(url, tags_key))
+        if fetched is None:
+            return {}
+        body, encoding = fetched
+        page = self._reuse_page(url, tags_key, body)
+        if page is not None:
+            return page
+        if body is None:
+            return {}  # 304 for a page that is no longer cached
         
-        results['links'] = list(self.get_links(html, url))
-        return results
-    
+        loop = asyncio.get_running_loop()
+        page = await loop.run_in_executor(self._executor(), _parse_worker, body, encoding,
+                                          tags_key, url, self._base_prefix, self._base_netloc)
+        self._remember_page(url, tags_key, body, page)
+        return page
+
     def scrape_multiple_pages(self, urls: List[str], tags: Dict[str, Optional[str]]) -> List[Dict[str, List[str]]]:
         """
-        Scrape data from multiple pages.
+        Scrape data from multiple pages, fetching up to `concurrency` pages at once.
 
         Parameters:
         - urls (List[str]): List of URLs to scrape.
@@ -64,17 +520,24 @@ class BasicWebScraper:
         Returns:
         - List[Dict[str, List[str]]]: A list of dictionaries containing scraped data for each URL.
         """
-        data = []
-        for url in urls:
-            print(f"Scraping {url}")
-            page_data = self.scrape_page(url, tags)
-            if page_data:
-                data.append(page_data)
-        return data
+        return asyncio.run(self.scrape_multiple_pages_async(urls, tags))
+
+    async def scrape_multiple_pages_async(self, urls: List[str], tags: Dict[str, Optional[str]]) -> List[Dict[str, List[str]]]:
+        """Coroutine version of scrape_multiple_pages."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._client_session() as session:
+            pages = await asyncio.gather(*[self._fetch_and_parse(session, semaphore, url, tags) for url in urls])
+        self._flush_cache()
+        return [page_data for page_data in pages if page_data]
     
     def crawl(self, tags: Dict[str, Optional[str]], max_pages: int = 50) -> List[Dict[str, List[str]]]:
         """
-        Crawl the site starting from base_url using BFS to scrape pages.
+        Crawl the site starting from base_url, most-linked pages first.
+
+        The frontier is ordered by how many scraped pages link to a URL, then by
+        link depth from base_url, so a limited max_pages budget goes to the most
+        popular, shallowest pages. Pages are fetched in batches of up to
+        `concurrency` URLs taken from the front of the frontier.
 
         Parameters:
         - tags (Dict[str, Optional[str]]): HTML tags and classes to scrape.
@@ -83,50 +546,130 @@ class BasicWebScraper:
         Returns:
         - List[Dict[str, List[str]]]: Scraped data for each page.
         """
-        queue = deque([self.base_url])  # Start with the base URL
+        return asyncio.run(self.crawl_async(tags, max_pages))
+
+    async def crawl_async(self, tags: Dict[str, Optional[str]], max_pages: int = 50) -> List[Dict[str, List[str]]]:
+        """Coroutine version of crawl."""
         scraped_data = []
+        await self._crawl(tags, max_pages, scraped_data.append)
+        return scraped_data
+
+    def crawl_to_file(self, tags: Dict[str, Optional[str]], filename: str, max_pages: int = 50) -> int:
+        """
+        Crawl like `crawl`, but stream each page to a JSON Lines file as it completes.
+
+        Pages are not kept in memory (with a cache_path they also go to the on-disk
+        cache), and the file can be read while the crawl is running.
+
+        Parameters:
+        - tags (Dict[str, Optional[str]]): HTML tags and classes to scrape.
+        - filename (str): Path of the JSON Lines file to write.
+        - max_pages (int): Maximum number of pages to scrape.
+
+        Returns:
+        - int: Number of pages written.
+        """
+        try:
+            with open(filename, 'wb') as fh:
+                count = asyncio.run(self._crawl(tags, max_pages, lambda page: self.save_page(page, fh)))
+            print(f"Data saved to {filename}")
+            return count
+        except IOError as e:
+            print(f"An error occurred while saving data: {e}")
+            return 0
+
+    async def _crawl(self, tags: Dict[str, Optional[str]], max_pages: int,
+                     on_page: Callable[[Dict[str, List[str]]], None]) -> int:
+        """Crawl from base_url, handing each scraped page to `on_page`; returns the page count."""
+        # Heap of (-in-degree, depth, url). heapq cannot reprioritise in place, so
+        # every in-degree increase pushes a fresh entry; entries whose in-degree no
+        # longer matches are stale and skipped when popped.
+        frontier: List[Tuple[int, int, str]] = []
+        # In-degree and shallowest depth of each URL still in the frontier
+        indegree: Dict[str, int] = {}
+        depths: Dict[str, int] = {}
+        self.seen.add(self.base_url)
+        scraped = 0
+        semaphore = asyncio.Semaphore(self.concurrency)
         
-        while queue and len(scraped_data) < max_pages:
-            url = queue.popleft()
-            if url in self.visited:
-                continue
-            print(f"Scraping {url}")
-            self.visited.add(url)
+        async with self._client_session() as session:
+            if await self._allowed(session, self.base_url):
+                heapq.heappush(frontier, (0, 0, self.base_url))  # Start with the base URL
+                indegree[self.base_url] = 0
+                depths[self.base_url] = 0
             
-            page_data = self.scrape_page(url, tags)
-            if page_data:
-                scraped_data.append(page_data)
+            while frontier and scraped < max_pages:
+                # Never fetch more pages than there are slots left under max_pages
+                batch_size = min(self.concurrency, max_pages - scraped)
+                batch = []
+                while frontier and len(batch) < batch_size:
+                    priority, depth, url = heapq.heappop(frontier)
+                    if indegree.get(url) != -priority:
+                        continue  # Superseded by a higher-priority entry, or already dispatched
+                    del indegree[url]
+                    del depths[url]
+                    key = self._key(url)
+                    if key in self.visited:
+                        continue
+                    self.visited.add(key)
+                    batch.append((url, depth))
                 
-                # Enqueue new internal links found on this page
-                new_links = page_data.get('links', [])
-                for link in new_links:
-                    if link not in self.visited:
-                        queue.append(link)
+                pages = await asyncio.gather(*[self._fetch_and_parse(session, semaphore, url, tags) for url, _ in batch])
+                self._flush_cache()
+                for (url, depth), page_data in zip(batch, pages):
+                    if not page_data:
+                        continue
+                    on_page(page_data)
+                    scraped += 1
+                    
+                    # Enqueue new internal links found on this page, each URL at most once
+                    new_links = page_data.get('links', [])
+                    for link in new_links:
+                        if link not in indegree:
+                            if link in self.seen:
+                                continue  # Already dispatched or disallowed
+                            self.seen.add(link)
+                            if not await self._allowed(session, link):
+                                continue
+                            indegree[link] = 0
+                            depths[link] = depth + 1
+                        indegree[link] += 1
+                        depths[link] = min(depths[link], depth + 1)
+                        heapq.heappush(frontier, (-indegree[link], depths[link], link))
         
-        return scraped_data
+        return scraped
+
+    def save_page(self, page: Dict[str, List[str]], fh: BinaryIO):
+        """Append one page of scraped data to an open binary file as a JSON line."""
+        fh.write(orjson.dumps(page))
+        fh.write(b'\n')
 
     def save_to_file(self, data: List[Dict[str, List[str]]], filename: str):
         """Save scraped data to a JSON file."""
         try:
-            with open(filename, 'w') as file:
-                json.dump(data, file, indent=4)
+            with open(filename, 'wb') as file:
+                file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             print(f"Data saved to {filename}")
         except IOError as e:
             print(f"An error occurred while saving data: {e}")
 
 # Example Usage
-# Initialize the scraper with a base URL
-scraper = BasicWebScraper("https://op.gg")
+if __name__ == "__main__":
+    # Initialize the scraper with a base URL
+    scraper = BasicWebScraper("https://op.gg")
 
-# Define tags and classes to scrape
-tags_to_scrape = {
-    'h1': None,          # Get all <h1> tags
-    'p': 'intro',        # Get <p> tags with the class 'intro'
-    'a': None            # Get all <a> tags for links
-}
+    # Define tags and classes to scrape
+    tags_to_scrape = {
+        'h1': None,          # Get all <h1> tags
+        'p': 'intro',        # Get <p> tags with the class 'intro'
+        'a': None            # Get all <a> tags for links
+    }
 
-# Run the crawl function with BFS to gather data
-scraped_data = scraper.crawl(tags_to_scrape, max_pages=10)
+    try:
+        # Run the crawl function to gather data
+        scraped_data = scraper.crawl(tags_to_scrape, max_pages=10)
 
-# Save the crawled data to a JSON file
-scraper.save_to_file(scraped_data, "crawled_data.json")
+        # Save the crawled data to a JSON file
+        scraper.save_to_file(scraped_data, "crawled_data.json")
+    finally:
+        scraper.close()
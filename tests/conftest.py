@@ -0,0 +1,5 @@
+import os
+import sys
+
+# app/ is a plain script directory, not a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'app'))
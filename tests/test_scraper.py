@@ -0,0 +1,209 @@
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+pytest.importorskip('lxml')
+pytest.importorskip('pybloom_live')
+
+import scraper as scraper_module  # noqa: E402
+from scraper import BasicWebScraper, _cached_urljoin, _detect_encoding, _join, _robots_parser  # noqa: E402
+
+BASE = "https://example.com/"
+
+
+class _NullSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _crawl_order(links, max_pages, robots_txt=None):
+    """Crawl a fake site given as {url: [links]} and return the URLs in fetch order."""
+    scraper = BasicWebScraper(BASE, concurrency=1, respect_robots=robots_txt is not None)
+    if robots_txt is not None:
+        scraper._robots['example.com'] = _robots_parser(BASE + 'robots.txt', 200, robots_txt)
+    fetched = []
+
+    async def fake_fetch_and_parse(session, semaphore, url, tags):
+        fetched.append(url)
+        return {'links': links.get(url, [])}
+
+    scraper._client_session = _NullSession
+    scraper._fetch_and_parse = fake_fetch_and_parse
+    try:
+        asyncio.run(scraper._crawl({}, max_pages, lambda page: None))
+    finally:
+        scraper.close()
+    return fetched
+
+
+def test_crawl_fetches_most_linked_pages_first():
+    # The home page links to a-d; each of those links to /z and to its own leaf
+    links = {BASE: [BASE + name for name in 'abcd']}
+    for name in 'abcd':
+        links[BASE + name] = [BASE + 'z', BASE + name + '1']
+
+    order = _crawl_order(links, max_pages=7)
+
+    # /z is queued at in-degree 1 by /a and overtakes /c once /b raises it to 2
+    assert order == [BASE, BASE + 'a', BASE + 'b', BASE + 'z', BASE + 'c', BASE + 'd', BASE + 'a1']
+
+
+def test_unknown_declared_charset_falls_back_to_detection():
+    assert _detect_encoding('<p>é</p>'.encode(), 'x-bogus') in ('utf-8', 'UTF-8')
+    assert _detect_encoding(b'<p>x</p>', 'windows-1252') == 'windows-1252'
+
+
+def test_parse_elements_detects_charset_of_undeclared_bytes():
+    scraper = BasicWebScraper(BASE)
+    try:
+        assert scraper.parse_elements('<h1>café</h1>'.encode(), 'h1') == ['café']
+        assert scraper.parse_elements('<h1>café</h1>'.encode('cp1252'), 'h1', encoding='windows-1252') == ['café']
+    finally:
+        scraper.close()
+
+
+def test_crawl_skips_links_disallowed_by_robots():
+    links = {BASE: [BASE + 'public', BASE + 'private/page']}
+
+    order = _crawl_order(links, max_pages=10, robots_txt="User-agent: *\nDisallow: /private\n")
+
+    assert order == [BASE, BASE + 'public']
+
+
+@pytest.mark.parametrize('status, allowed', [
+    (None, True),   # Network error
+    (401, False),
+    (403, False),
+    (404, True),
+    (503, False),
+])
+def test_robots_status_mapping(status, allowed):
+    robots = _robots_parser(BASE + 'robots.txt', status, '')
+    assert robots.can_fetch('BasicWebScraper/1.0', BASE + 'page') is allowed
+
+
+def test_load_robots_allows_all_on_network_error():
+    class FailingSession:
+        def get(self, url):
+            raise aiohttp.ClientConnectionError('unreachable')
+
+    scraper = BasicWebScraper(BASE)
+    try:
+        robots = asyncio.run(scraper._load_robots(FailingSession(), BASE + 'robots.txt'))
+    finally:
+        scraper.close()
+    assert robots.can_fetch('BasicWebScraper/1.0', BASE + 'page')
+
+
+def test_get_links_canonicalises_absolute_hrefs():
+    html = ('<a href="https://example.com/a\n">a</a>'
+            '<a href="https://example.com/b?">b</a>'
+            '<a href="https://example.com/c#">c</a>'
+            '<a href="/b">b again</a>')
+    scraper = BasicWebScraper(BASE)
+    try:
+        links = scraper.get_links(html, BASE + 'page')
+    finally:
+        scraper.close()
+    assert links == {BASE + 'a', BASE + 'b', BASE + 'c'}
+
+
+def test_join_shares_cache_for_root_relative_hrefs_across_pages():
+    assert _join(BASE + 'a/b', '/nav') == _join(BASE + 'c?q=1', '/nav') == BASE + 'nav'
+    hits = _cached_urljoin.cache_info().hits
+    _join(BASE + 'd/e/f', '/nav')
+    assert _cached_urljoin.cache_info().hits == hits + 1
+    assert _join(BASE + 'a/b', 'c') == BASE + 'a/c'  # Path-relative hrefs still use the page URL
+
+
+TAGS = {'h1': None, 'p': 'intro'}
+
+
+def _cached_run(cache_path, monkeypatch, responses, tags=TAGS):
+    """
+    scrape_page BASE once per scripted response with a fresh cached scraper.
+
+    Each response is (status, body, etag) or a callable run on the scraper that returns one.
+    Returns the pages, the headers each request sent, and how many pages were parsed.
+    """
+    parses = []
+    monkeypatch.setattr(scraper_module, '_parse_worker',
+                        lambda body, *args: parses.append(body) or {'h1': [body.decode()], 'links': []})
+    scraper = BasicWebScraper(BASE, cache_path=str(cache_path))
+    sent = []
+
+    def fake_fetch_html(url, headers=None):
+        sent.append(headers)
+        response = responses.pop(0)
+        status, body, etag = response(scraper) if callable(response) else response
+        if status == 304:
+            return None, None
+        scraper._remember_validators(url, etag, None)
+        return body, 'utf-8'
+
+    scraper.fetch_html = fake_fetch_html
+    try:
+        pages = [scraper.scrape_page(BASE, tags) for _ in list(responses)]
+    finally:
+        scraper.close()
+    return pages, sent, len(parses)
+
+
+def test_cache_reuses_stored_page_on_304(tmp_path, monkeypatch):
+    cache = tmp_path / 'cache.db'
+    _cached_run(cache, monkeypatch, [(200, b'v1', '"e1"')])
+
+    pages, sent, parses = _cached_run(cache, monkeypatch, [(304, None, None)])
+
+    assert sent == [{'If-None-Match': '"e1"'}]
+    assert pages == [{'h1': ['v1'], 'links': []}]
+    assert parses == 0
+
+
+def test_cache_updates_validators_for_unchanged_body(tmp_path, monkeypatch):
+    cache = tmp_path / 'cache.db'
+    _cached_run(cache, monkeypatch, [(200, b'v1', '"e1"')])
+
+    pages, _, parses = _cached_run(cache, monkeypatch, [(200, b'v1', '"e2"')])
+    assert pages == [{'h1': ['v1'], 'links': []}]
+    assert parses == 0
+
+    _, sent, _ = _cached_run(cache, monkeypatch, [(304, None, None)])
+    assert sent == [{'If-None-Match': '"e2"'}]
+
+
+def test_cache_304_without_stored_page_returns_nothing(tmp_path, monkeypatch):
+    cache = tmp_path / 'cache.db'
+    _cached_run(cache, monkeypatch, [(200, b'v1', '"e1"')])
+
+    def drop_row_then_304(scraper):
+        scraper._http_cache.execute("DELETE FROM http_cache")
+        return 304, None, None
+
+    pages, _, _ = _cached_run(cache, monkeypatch, [drop_row_then_304])
+    assert pages == [{}]
+
+
+def test_cache_ignores_pages_scraped_with_other_tags(tmp_path, monkeypatch):
+    cache = tmp_path / 'cache.db'
+    _cached_run(cache, monkeypatch, [(200, b'v1', '"e1"')])
+
+    _, sent, parses = _cached_run(cache, monkeypatch, [(200, b'v1', '"e1"')], tags={'h1': None})
+
+    assert sent == [{}]
+    assert parses == 1
+
+
+def test_cache_matches_tags_given_in_any_order(tmp_path, monkeypatch):
+    cache = tmp_path / 'cache.db'
+    _cached_run(cache, monkeypatch, [(200, b'v1', '"e1"')], tags={'h1': None, 'p': 'intro'})
+
+    _, sent, parses = _cached_run(cache, monkeypatch, [(304, None, None)], tags={'p': 'intro', 'h1': None})
+
+    assert sent == [{'If-None-Match': '"e1"'}]
+    assert parses == 0